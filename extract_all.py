@@ -6,17 +6,23 @@ Extracts data from all errata pages and saves to CSV.
 
 import sys
 import os
-import yaml
+import time
+import queue
+import traceback
+import argparse
 import logging
 from pathlib import Path
 from datetime import datetime
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 
 # Add the src directory to the Python path
 sys.path.append(str(Path(__file__).parent / 'src'))
 
-from auth import WebAuthenticator
-from parser import ErrataParser
-from csv_writer import CSVWriter
+from config_loader import load_config
+
+# Selenium, pandas and the scraping modules are imported inside the functions
+# that need them, so --help and the credential check stay fast.
 
 def setup_logging():
     """Set up logging configuration."""
@@ -32,44 +38,79 @@ def setup_logging():
         ]
     )
 
+def parse_args():
+    """Parse command line arguments."""
+    arg_parser = argparse.ArgumentParser(description="Extract errata data from all configured pages and save to CSV")
+    arg_parser.add_argument(
+        '--workers', '-w',
+        type=int,
+        default=1,
+        help='Number of browser sessions used to extract pages concurrently (default: 1)'
+    )
+    return arg_parser.parse_args()
+
+def extract_page(driver, parser, full_url, logger):
+    """Navigate to a single errata page and parse its records."""
+    from selenium.common.exceptions import TimeoutException
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+    
+    driver.get(full_url)
+    
+    # Wait for the errata accordions to render instead of a fixed sleep
+    try:
+        WebDriverWait(driver, 10).until(EC.presence_of_element_located(parser.container_locator))
+    except TimeoutException:
+        logger.warning(f"Timed out waiting for errata container on {full_url}")
+        time.sleep(0.5)
+    
+    return parser.parse_page_with_selenium(driver)
+
 def main():
     """Main extraction function."""
     
+    args = parse_args()
     setup_logging()
     logger = logging.getLogger(__name__)
     
     print("🔍 Errata Locator - Full Extraction")
     print("=" * 50)
     
-    # Load configuration
-    try:
-        with open('src/config/config.yaml', 'r') as f:
-            config = yaml.safe_load(f)
-        logger.info("Configuration loaded successfully")
-    except Exception as e:
-        logger.error(f"Failed to load configuration: {e}")
-        return 1
-    
-    # Load credentials
+    # Load credentials first so a missing .env fails before any setup work
     from dotenv import load_dotenv
     load_dotenv()
     
     username = os.getenv('ERRATA_USERNAME')
     password = os.getenv('ERRATA_PASSWORD')
     
-    if not username or not password or username == 'your_username_here':
+    if not (username and password and username != 'your_username_here'):
         print("❌ Please update the .env file with your actual credentials")
         print("   ERRATA_USERNAME=your_actual_username")
         print("   ERRATA_PASSWORD=your_actual_password")
         return 1
     
+    # Load configuration
+    try:
+        config = load_config('src/config/config.yaml')
+        logger.info("Configuration loaded successfully")
+    except Exception as e:
+        logger.error(f"Failed to load configuration: {e}")
+        return 1
+    
     # Initialize components
+    from auth import WebAuthenticator
+    from parser import ErrataParser
+    from csv_writer import CSVWriter
+    
     authenticator = WebAuthenticator(config)
     parser = ErrataParser(config)
     csv_writer = CSVWriter(config)
     
     driver = None
-    all_records = []
+    extra_drivers = []
+    record_count = 0
+    unit_counts = Counter()
+    sample_records = []
     
     try:
         # Authenticate
@@ -89,58 +130,70 @@ def main():
         
         print(f"\n📄 Extracting data from {len(errata_pages)} pages...")
         
-        for i, page_path in enumerate(errata_pages):
-            page_name = page_path.split('-')[1].replace('-', ' ').title() if '-' in page_path else f"Page {i+1}"
-            print(f"\n🔄 Processing: {page_name}")
-            
-            # Navigate to the page
-            full_url = base_url + page_path
-            driver.get(full_url)
-            
-            # Wait for page to load
-            import time
-            time.sleep(3)
-            
-            # Parse the page
-            page_records = parser.parse_page_with_selenium(driver)
+        # Each worker owns one browser; extra browsers reuse the login session
+        workers = max(1, min(args.workers, len(errata_pages)))
+        drivers = queue.Queue()
+        drivers.put(driver)
+        for _ in range(workers - 1):
+            extra_driver = authenticator.clone_authenticated_driver()
+            extra_drivers.append(extra_driver)
+            drivers.put(extra_driver)
+        
+        if workers > 1:
+            print(f"🚀 Using {workers} browser sessions")
+        
+        def process_page(page_path):
+            page_driver = drivers.get()
+            try:
+                return extract_page(page_driver, parser, base_url + page_path, logger)
+            finally:
+                drivers.put(page_driver)
+        
+        # Records are streamed to disk page by page instead of held in memory
+        csv_writer.open_stream()
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # map() yields results in page order, keeping the CSV ordering stable
+            page_results = executor.map(process_page, errata_pages)
             
-            if page_records:
-                all_records.extend(page_records)
-                print(f"  ✅ Extracted {len(page_records)} records")
+            for i, (page_path, page_records) in enumerate(zip(errata_pages, page_results)):
+                page_name = page_path.split('-')[1].replace('-', ' ').title() if '-' in page_path else f"Page {i+1}"
+                print(f"\n🔄 Processing: {page_name}")
                 
-                # Show sample
                 if page_records:
-                    sample = page_records[0]
-                    print(f"  📝 Sample: {sample['Unit']} - {sample['Resource']}")
-            else:
-                print(f"  ⚠️  No records found")
+                    record_count = csv_writer.write_stream_rows(page_records)
+                    unit_counts.update(record['Unit'] for record in page_records)
+                    sample_records.extend(page_records[:3 - len(sample_records)])
+                    print(f"  ✅ Extracted {len(page_records)} records")
+                    
+                    # Show sample
+                    if page_records:
+                        sample = page_records[0]
+                        print(f"  📝 Sample: {sample['Unit']} - {sample['Resource']}")
+                else:
+                    print(f"  ⚠️  No records found")
         
-        print(f"\n📊 Total records extracted: {len(all_records)}")
+        print(f"\n📊 Total records extracted: {record_count}")
         
-        if all_records:
+        if record_count:
             # Save to CSV
             print("\n💾 Saving to CSV...")
             
-            # Ensure output directory exists
-            output_dir = Path("output")
-            output_dir.mkdir(exist_ok=True)
+            if not csv_writer.close_stream(commit=True):
+                logger.error("Failed to save extracted data")
+                return 1
             
-            csv_path = csv_writer.write_errata_data(all_records)
+            csv_path = csv_writer.csv_path
             print(f"✅ Data saved to: {csv_path}")
             
             # Show summary by unit
             print("\n📈 Summary by Unit:")
-            unit_counts = {}
-            for record in all_records:
-                unit = record['Unit']
-                unit_counts[unit] = unit_counts.get(unit, 0) + 1
-            
             for unit, count in sorted(unit_counts.items()):
                 print(f"  {unit}: {count} records")
             
             # Show sample of saved data
             print(f"\n🔍 Sample of extracted data:")
-            for i, record in enumerate(all_records[:3]):
+            for i, record in enumerate(sample_records):
                 print(f"\nRecord {i+1}:")
                 print(f"  Date Extracted: {record['Date_Extracted']}")
                 print(f"  Unit: {record['Unit']}")
@@ -159,12 +212,16 @@ def main():
     
     except Exception as e:
         logger.error(f"Error during extraction: {e}")
-        import traceback
         traceback.print_exc()
         return 1
     
     finally:
-        # Clean up
+        # Clean up; discards the stream if the run did not complete
+        csv_writer.close_stream(commit=False)
+        
+        for extra_driver in extra_drivers:
+            extra_driver.quit()
+        
         if driver:
             driver.quit()
             print("\n🧹 Browser closed")
@@ -16,47 +16,60 @@ and saves it to a CSV file with the following columns:
 
 import os
 import sys
+import shutil
 import argparse
 import logging
-import colorlog
 from pathlib import Path
 from typing import Dict, Any
 
-import yaml
-from dotenv import load_dotenv
-
 # Add src directory to path for imports
 sys.path.append(str(Path(__file__).parent / 'src'))
 
-from scraper import ErrataScraper
+from config_loader import load_config as load_config_file
+
+# colorlog, python-dotenv and the scraper (which pulls in Selenium) are imported
+# inside the functions that need them, so --help and --validate-setup stay fast.
+
+# Logging formats shared by every setup_logging call
+DEFAULT_LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+LOG_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+LOG_COLORS = {
+    'DEBUG': 'cyan',
+    'INFO': 'green',
+    'WARNING': 'yellow',
+    'ERROR': 'red',
+    'CRITICAL': 'red,bg_white',
+}
+
+# Set once setup_logging has attached its handlers
+_LOGGING_CONFIGURED = False
 
 
 def setup_logging(config: Dict[str, Any]) -> None:
-    """Set up logging configuration with colors."""
+    """Set up logging configuration with colors (only the first call has an effect)."""
+    global _LOGGING_CONFIGURED
+    if _LOGGING_CONFIGURED:
+        return
     
     # Create logs directory if it doesn't exist
     log_file = Path(config.get('logging', {}).get('file', './logs/errata_locator.log'))
     log_file.parent.mkdir(parents=True, exist_ok=True)
     
+    import colorlog
+    
     # Set up colored console logging
     console_handler = colorlog.StreamHandler()
     console_handler.setFormatter(colorlog.ColoredFormatter(
-        '%(log_color)s%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S',
-        log_colors={
-            'DEBUG': 'cyan',
-            'INFO': 'green',
-            'WARNING': 'yellow',
-            'ERROR': 'red',
-            'CRITICAL': 'red,bg_white',
-        }
+        '%(log_color)s' + DEFAULT_LOG_FORMAT,
+        datefmt=LOG_DATE_FORMAT,
+        log_colors=LOG_COLORS
     ))
     
     # Set up file logging
     file_handler = logging.FileHandler(log_file, encoding='utf-8')
     file_handler.setFormatter(logging.Formatter(
-        config.get('logging', {}).get('format', '%(asctime)s - %(name)s - %(levelname)s - %(message)s'),
-        datefmt='%Y-%m-%d %H:%M:%S'
+        config.get('logging', {}).get('format', DEFAULT_LOG_FORMAT),
+        datefmt=LOG_DATE_FORMAT
     ))
     
     # Configure root logger
@@ -64,6 +77,7 @@ def setup_logging(config: Dict[str, Any]) -> None:
     root_logger.setLevel(getattr(logging, config.get('logging', {}).get('level', 'INFO')))
     root_logger.addHandler(console_handler)
     root_logger.addHandler(file_handler)
+    _LOGGING_CONFIGURED = True
     
     # Reduce noise from third-party libraries
     logging.getLogger('selenium').setLevel(logging.WARNING)
@@ -77,15 +91,8 @@ def load_config(config_path: str = None) -> Dict[str, Any]:
     if config_path is None:
         config_path = Path(__file__).parent / 'config' / 'config.yaml'
     
-    config_path = Path(config_path)
-    
-    if not config_path.exists():
-        raise FileNotFoundError(f"Configuration file not found: {config_path}")
-    
-    with open(config_path, 'r', encoding='utf-8') as f:
-        config = yaml.safe_load(f)
-    
-    return config
+    # Parsed with the libyaml C loader when available
+    return load_config_file(config_path)
 
 
 def load_environment_variables() -> None:
@@ -94,6 +101,7 @@ def load_environment_variables() -> None:
     env_file = Path(__file__).parent / 'config' / '.env'
     
     if env_file.exists():
+        from dotenv import load_dotenv
         load_dotenv(env_file)
         print(f"Loaded environment variables from {env_file}")
     else:
@@ -108,7 +116,6 @@ def create_sample_env_file() -> None:
     env_path = Path(__file__).parent / 'config' / '.env'
     
     if template_path.exists() and not env_path.exists():
-        import shutil
         shutil.copy2(template_path, env_path)
         print(f"Created sample .env file at {env_path}")
         print("Please edit this file and add your actual credentials")
@@ -182,7 +189,7 @@ Examples:
     parser.add_argument(
         '--use-requests', '-r',
         action='store_true',
-        help='Use requests-html instead of Selenium (faster but may miss dynamic content)'
+        help='Use requests instead of Selenium (faster but may miss dynamic content)'
     )
     
     parser.add_argument(
@@ -214,7 +221,7 @@ Examples:
         logger = logging.getLogger(__name__)
         
         logger.info("Starting Errata Locator")
-        logger.info(f"Configuration loaded from: {args.config or 'config/config.yaml'}")
+        logger.info("Configuration loaded from: %s", args.config or 'config/config.yaml')
         
         # Validate setup
         if not validate_setup():
@@ -222,12 +229,13 @@ Examples:
             return 1
         
         # Initialize scraper
+        from scraper import ErrataScraper
         scraper = ErrataScraper(config)
         
         # Determine whether to use Selenium or requests
         use_selenium = not args.use_requests
-        method = "Selenium" if use_selenium else "requests-html"
-        logger.info(f"Using {method} for web scraping")
+        method = "Selenium" if use_selenium else "requests"
+        logger.info("Using %s for web scraping", method)
         
         # Run requested operation
         success = False
@@ -250,7 +258,7 @@ Examples:
             
             if not args.test_auth:
                 stats = scraper.get_extraction_stats()
-                logger.info(f"Extraction statistics: {stats}")
+                logger.info("Extraction statistics: %s", stats)
             
             return 0
         else:
@@ -263,7 +271,7 @@ Examples:
         
     except Exception as e:
         if 'logger' in locals():
-            logger.error(f"Unexpected error: {e}", exc_info=True)
+            logger.error("Unexpected error: %s", e, exc_info=True)
         else:
             print(f"Error: {e}")
         return 1
@@ -3,13 +3,18 @@ Authentication module for handling login to the curriculum website.
 """
 
 import os
-import time
+import re
 import logging
+import requests
 import urllib3
 from typing import Optional, Dict, Any
-from requests_html import HTMLSession
+from bs4 import BeautifulSoup, SoupStrainer
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from selenium import webdriver
 from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
@@ -17,6 +22,24 @@ from selenium.webdriver.chrome.options import Options
 # Disable SSL warnings for corporate VPNs
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+# Resources the scraper never inspects, blocked via the DevTools protocol:
+# web fonts and third-party analytics/tracking scripts
+BLOCKED_URL_PATTERNS = [
+    '*.woff', '*.woff2', '*.ttf', '*.otf',
+    '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*',
+    '*segment.io*', '*segment.com*', '*intercom.io*', '*intercomcdn.com*',
+    '*hotjar.com*', '*newrelic.com*', '*nr-data.net*',
+]
+
+# Sets both login fields in one call; the input events keep Vue's v-model in sync
+FILL_LOGIN_FORM_SCRIPT = """
+for (let i = 0; i < arguments.length; i += 2) {
+    const field = arguments[i];
+    field.value = arguments[i + 1];
+    field.dispatchEvent(new Event('input', {bubbles: true}));
+}
+"""
+
 
 class AuthenticationError(Exception):
     """Custom exception for authentication failures."""
@@ -29,37 +52,89 @@ class WebAuthenticator:
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self.logger = logging.getLogger(__name__)
-        self.session: Optional[HTMLSession] = None
+        self.session: Optional[requests.Session] = None
         self.driver: Optional[webdriver.Chrome] = None
         
-    def setup_selenium_driver(self) -> webdriver.Chrome:
-        """Set up Chrome WebDriver with VPN-friendly options (same as working version)."""
+        # Success indicators for requests-based login, matched in a single regex pass
+        success_indicators = [
+            config['login']['success_indicator'],
+            'dashboard', 'main-content', 'logout', 'profile'
+        ]
+        self.success_pattern = re.compile(
+            '|'.join(re.escape(indicator) for indicator in success_indicators),
+            re.IGNORECASE
+        )
+        
+    def setup_selenium_driver(self, use_profile: bool = True) -> webdriver.Chrome:
+        """
+        Set up Chrome WebDriver with VPN-friendly options (same as working version).
+        
+        Args:
+            use_profile: Use the persistent Chrome profile from
+                scraping.chrome_profile_dir when one is configured
+        """
         chrome_options = Options()
         
-        # EXACT same options as working kindergarten script
-        chrome_options.add_argument('--disable-web-security')
+        # Same options as working kindergarten script, minus --disable-web-security
+        # (same-origin scraping does not need it and it disables site isolation)
         chrome_options.add_argument('--ignore-certificate-errors')
         chrome_options.add_argument('--allow-running-insecure-content')
         chrome_options.add_argument('--no-sandbox')
         chrome_options.add_argument('--disable-dev-shm-usage')
-        
-        # Add headless mode for CI environments (GitHub Actions)
-        if os.getenv('CI') or os.getenv('GITHUB_ACTIONS'):
-            chrome_options.add_argument('--headless')
+        chrome_options.add_argument('--disable-extensions')
+
+        # Return from get() at DOMContentLoaded; callers wait for the elements they need
+        chrome_options.page_load_strategy = 'eager'
+
+        # Skip images; stylesheets stay on because element text depends on them
+        chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+        chrome_options.add_experimental_option(
+            'prefs', {'profile.managed_default_content_settings.images': 2}
+        )
+
+        # Optional persistent profile so the login session survives between runs
+        profile_dir = self.config['scraping'].get('chrome_profile_dir')
+        if use_profile and profile_dir:
+            chrome_options.add_argument(f'--user-data-dir={os.path.abspath(profile_dir)}')
+            self.logger.info(f"Using Chrome profile: {profile_dir}")
+
+        # Run headless unless ERRATA_HEADED=1 asks for a visible window (always headless in CI)
+        in_ci = os.getenv('CI') or os.getenv('GITHUB_ACTIONS')
+        if in_ci or os.getenv('ERRATA_HEADED') != '1':
+            chrome_options.add_argument('--headless=new')
             chrome_options.add_argument('--disable-gpu')
-            chrome_options.add_argument('--window-size=1920,1080')
-            self.logger.info("Running in CI mode - Chrome will run headless")
+            self.logger.info("Chrome will run headless")
+        chrome_options.add_argument('--window-size=1920,1080')
         
         try:
             # Use system Chrome directly (no WebDriverManager)
             driver = webdriver.Chrome(options=chrome_options)
             driver.set_page_load_timeout(30)
-            
+
+            # Block web fonts and trackers as well
+            try:
+                driver.execute_cdp_cmd('Network.enable', {})
+                driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+            except Exception as e:
+                self.logger.debug(f"Could not set blocked URLs: {e}")
+
             return driver
         except Exception as e:
             self.logger.error(f"Failed to create Chrome driver: {e}")
             raise
     
+    def _get_or_create_driver(self) -> webdriver.Chrome:
+        """Return the current driver if its browser is still alive, otherwise start a new one."""
+        if self.driver:
+            try:
+                self.driver.current_url
+                return self.driver
+            except Exception:
+                self.logger.info("Existing Chrome session is gone, starting a new one")
+                self.driver = None
+        
+        return self.setup_selenium_driver()
+    
     def login_with_selenium(self, username: str, password: str) -> bool:
         """
         Perform login using Selenium WebDriver (exact working method).
@@ -75,35 +150,45 @@ class WebAuthenticator:
             AuthenticationError: If login fails
         """
         try:
-            self.driver = self.setup_selenium_driver()
+            self.driver = self._get_or_create_driver()
             
             # Navigate to login page
             login_url = self.config['website']['base_url'] + self.config['website']['login_url']
             self.logger.info(f"🌐 Logging in at: {login_url}")
             self.driver.get(login_url)
             
+            # The site redirects signed-in users away from /login, so a reused
+            # browser or a persistent profile with a valid session is done here
+            if "/login" not in self.driver.current_url:
+                self.logger.info(f"✅ Reusing existing session! Current URL: {self.driver.current_url}")
+                return True
+            
             # Wait for Vue.js component (exact same as working version)
             wait = WebDriverWait(self.driver, 20)
             wait.until(EC.presence_of_element_located((By.ID, "sessions-new-feature")))
-            time.sleep(3)
+            # Proceed as soon as the rendered form can take input
+            email_field = wait.until(EC.element_to_be_clickable((By.NAME, "auth_key")))
             
             # Fill login form with exact same field names as working version
-            email_field = self.driver.find_element(By.NAME, "auth_key")
             password_field = self.driver.find_element(By.NAME, "password")
             
-            email_field.clear()
-            email_field.send_keys(username)
-            password_field.clear()
-            password_field.send_keys(password)
+            self.driver.execute_script(
+                FILL_LOGIN_FORM_SCRIPT, email_field, username, password_field, password
+            )
             
             # Submit with Enter key (exact same as working version)
-            from selenium.webdriver.common.keys import Keys
             password_field.send_keys(Keys.RETURN)
-            time.sleep(5)
+            
+            # Wait until the redirects land on a signed-in page; a timeout falls
+            # through to the failure check below
+            try:
+                WebDriverWait(self.driver, 15).until(lambda d: self._is_logged_in_url(d.current_url))
+            except TimeoutException:
+                pass
             
             # Check for success (exact same logic as working version)
             current_url = self.driver.current_url
-            if "/login" not in current_url and ("welcome" in current_url or "resources" in current_url):
+            if self._is_logged_in_url(current_url):
                 self.logger.info(f"✅ Login successful! Current URL: {current_url}")
                 return True
             else:
@@ -114,9 +199,14 @@ class WebAuthenticator:
             self.logger.error(f"Login failed with error: {e}")
             raise AuthenticationError(f"Authentication failed: {e}")
     
+    @staticmethod
+    def _is_logged_in_url(url: str) -> bool:
+        """Check whether a URL is one the site only serves to signed-in users."""
+        return "/login" not in url and ("welcome" in url or "resources" in url)
+    
     def login_with_requests(self, username: str, password: str) -> bool:
         """
-        Perform login using requests-html session with VPN support.
+        Perform login using a requests session with VPN support.
         
         Args:
             username: User's login username
@@ -126,7 +216,20 @@ class WebAuthenticator:
             bool: True if login successful, False otherwise
         """
         try:
-            self.session = HTMLSession()
+            self.session = requests.Session()
+            
+            # Pooled keep-alive connections; idempotent requests retry on gateway errors
+            adapter = HTTPAdapter(
+                pool_connections=16,
+                pool_maxsize=16,
+                max_retries=Retry(
+                    total=self.config['scraping'].get('max_retries', 3),
+                    backoff_factor=0.3,
+                    status_forcelist=[502, 503, 504]
+                )
+            )
+            self.session.mount('http://', adapter)
+            self.session.mount('https://', adapter)
             
             # VPN-friendly session configuration
             self.session.verify = False  # Skip SSL verification for corporate certs
@@ -162,31 +265,26 @@ class WebAuthenticator:
                 self.logger.error(f"Login page returned status {response.status_code}")
                 return False
             
-            # Try to render JavaScript (but don't fail if it doesn't work on VPN)
-            try:
-                response.html.render(timeout=20)
-            except Exception as e:
-                self.logger.warning(f"Could not render JavaScript (VPN issue): {e}")
-                # Continue without JavaScript rendering
-            
             # Prepare login data
             login_data = {
                 'username': username,
                 'password': password,
                 'email': username,  # Some sites use email field
+                'auth_key': username,  # Field name used by the site's login form
             }
             
-            # Look for CSRF token if present
+            # Look for CSRF token if present; only <input> tags are needed for this
             try:
-                csrf_token = response.html.find('input[name="csrf_token"]', first=True)
+                form_inputs = BeautifulSoup(response.text, 'lxml', parse_only=SoupStrainer('input'))
+                csrf_token = form_inputs.select_one('input[name="csrf_token"]')
                 if csrf_token:
-                    login_data['csrf_token'] = csrf_token.attrs.get('value', '')
+                    login_data['csrf_token'] = csrf_token.get('value', '')
                 
                 # Check for other common token names
                 for token_name in ['authenticity_token', '_token', 'csrfmiddlewaretoken']:
-                    token_elem = response.html.find(f'input[name="{token_name}"]', first=True)
+                    token_elem = form_inputs.select_one(f'input[name="{token_name}"]')
                     if token_elem:
-                        login_data[token_name] = token_elem.attrs.get('value', '')
+                        login_data[token_name] = token_elem.get('value', '')
                         break
             except Exception as e:
                 self.logger.warning(f"Could not find CSRF token: {e}")
@@ -204,15 +302,10 @@ class WebAuthenticator:
             self.logger.info(f"Final URL: {login_response.url}")
             
             # Check if login was successful
-            success_indicators = [
-                self.config['login']['success_indicator'],
-                'dashboard', 'main-content', 'logout', 'profile'
-            ]
-            
-            for indicator in success_indicators:
-                if indicator in login_response.text.lower():
-                    self.logger.info(f"Login successful! Found indicator: {indicator}")
-                    return True
+            indicator_match = self.success_pattern.search(login_response.text)
+            if indicator_match:
+                self.logger.info(f"Login successful! Found indicator: {indicator_match.group(0)}")
+                return True
             
             # Additional check: if we're redirected away from login page, it might be success
             if 'login' not in login_response.url.lower():
@@ -226,14 +319,49 @@ class WebAuthenticator:
             self.logger.error(f"Login failed with error: {e}")
             return False
     
-    def get_authenticated_session(self) -> Optional[HTMLSession]:
+    def get_authenticated_session(self) -> Optional[requests.Session]:
         """Get the authenticated requests session."""
         return self.session
     
     def get_authenticated_driver(self) -> Optional[webdriver.Chrome]:
         """Get the authenticated Selenium driver."""
         return self.driver
-    
+
+    def clone_authenticated_driver(self) -> webdriver.Chrome:
+        """
+        Start an additional Chrome driver that shares the current login session.
+
+        The session cookies of the authenticated driver are replayed into the
+        new browser, so no second login is needed. The caller owns the
+        returned driver and is responsible for quitting it.
+
+        Returns:
+            webdriver.Chrome: New driver carrying the authenticated session
+
+        Raises:
+            AuthenticationError: If there is no authenticated driver to clone
+        """
+        if not self.driver:
+            raise AuthenticationError("No authenticated driver available to clone")
+
+        # Chrome locks a profile directory to one browser, so clones start clean
+        driver = self.setup_selenium_driver(use_profile=False)
+
+        try:
+            # Cookies can only be set for the domain that is currently loaded
+            driver.get(self.config['website']['base_url'])
+            for cookie in self.driver.get_cookies():
+                try:
+                    driver.add_cookie(cookie)
+                except Exception as e:
+                    self.logger.debug(f"Could not copy cookie '{cookie.get('name')}': {e}")
+        except Exception:
+            # The caller never receives this driver, so close its browser here
+            driver.quit()
+            raise
+
+        return driver
+
     def logout(self):
         """Clean up and logout."""
         if self.session:
@@ -250,10 +378,12 @@ class WebAuthenticator:
         """Check if currently authenticated."""
         if self.driver:
             try:
-                # Check if we can still find the success indicator
-                self.driver.find_element(By.CSS_SELECTOR, self.config['login']['success_indicator'])
+                # Check if we can still find the success indicator, allowing a short render delay
+                WebDriverWait(self.driver, 2).until(EC.presence_of_element_located(
+                    (By.CSS_SELECTOR, self.config['login']['success_indicator'])
+                ))
                 return True
-            except:
+            except (TimeoutException, WebDriverException):
                 return False
         return False
 
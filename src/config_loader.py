@@ -0,0 +1,48 @@
+"""
+Configuration loading module with a cached YAML parser.
+"""
+
+import copy
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Any, Union
+
+import yaml
+
+# Prefer the libyaml C loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+
+def load_config(config_path: Union[str, Path]) -> Dict[str, Any]:
+    """
+    Load configuration from a YAML file.
+
+    The parsed result is cached per file and modification time, so repeated
+    loads of an unchanged file skip YAML parsing entirely.
+
+    Args:
+        config_path: Path to the YAML configuration file
+
+    Returns:
+        Dict[str, Any]: Parsed configuration (a private copy for the caller)
+
+    Raises:
+        FileNotFoundError: If the configuration file does not exist
+    """
+    config_path = Path(config_path).resolve()
+
+    if not config_path.exists():
+        raise FileNotFoundError(f"Configuration file not found: {config_path}")
+
+    config = _parse_config(str(config_path), config_path.stat().st_mtime_ns)
+    return copy.deepcopy(config)
+
+
+@lru_cache(maxsize=4)
+def _parse_config(config_path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a YAML file; mtime_ns is part of the cache key so edits are picked up."""
+    with Path(config_path).open(encoding='utf-8') as f:
+        return yaml.load(f, Loader=YamlLoader)
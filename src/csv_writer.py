@@ -3,13 +3,48 @@ CSV writer module for formatting and saving errata data.
 """
 
 import os
+import re
 import csv
+import shutil
+import hashlib
 import pandas as pd
 import logging
 from datetime import datetime
-from typing import List, Dict, Any
+from collections import Counter
+from typing import List, Dict, Any, Optional
 from pathlib import Path
 
+# Fast paths for the date shapes seen on the errata pages
+ISO_DATE_PATTERN = re.compile(r'(\d{4})-(\d{2})-(\d{2})')
+US_DATE_PATTERN = re.compile(r'(\d{1,2})/(\d{1,2})/(\d{4}|\d{2})')
+
+# Columns that identify an errata record for duplicate detection
+DEDUP_KEY_COLUMNS = ('Unit', 'Resource', 'Location', 'Instructional_Moment', 'Page_Numbers')
+
+# Fallback formats tried in order when no fast path applies
+DATE_FORMATS = (
+    '%m/%d/%y',      # 8/4/25
+    '%m/%d/%Y',      # 8/4/2025
+    '%m-%d-%y',      # 8-4-25
+    '%m-%d-%Y',      # 8-4-2025
+    '%Y-%m-%d',      # 2025-08-28
+    '%Y/%m/%d',      # 2025/08/28
+    '%d/%m/%y',      # 4/8/25 (day first)
+    '%d/%m/%Y',      # 4/8/2025 (day first)
+)
+
+
+def _is_iso_date(date_str: str) -> bool:
+    """Check that a string is a real calendar date in zero-padded YYYY-MM-DD form."""
+    match = ISO_DATE_PATTERN.fullmatch(date_str)
+    if not match:
+        return False
+    try:
+        datetime(*map(int, match.groups()))
+        return True
+    except ValueError:
+        return False
+
 
 class CSVWriter:
     """Handles writing errata data to CSV files."""
@@ -19,8 +54,17 @@ class CSVWriter:
         self.logger = logging.getLogger(__name__)
         self.csv_path = Path(config['output']['csv_path'])
         self.backup_path = Path(config['output']['backup_path'])
+        # Sidecar index of record key hashes, so deduplication doesn't re-read the CSV
+        self.keys_path = self.csv_path.with_suffix('.keys')
         self.columns = config['output']['csv_columns']
         
+        # Incremental write state, set up by open_stream()
+        self._stream_file = None
+        self._stream_path: Optional[Path] = None
+        self._stream_writer: Optional[csv.DictWriter] = None
+        self._stream_count = 0
+        self._stream_key_hashes: List[str] = []
+        
         # Ensure output directories exist
         self.csv_path.parent.mkdir(parents=True, exist_ok=True)
         self.backup_path.mkdir(parents=True, exist_ok=True)
@@ -41,27 +85,24 @@ class CSVWriter:
         date_str = str(date_str).strip()
         
         # If already in YYYY-MM-DD format, return as-is
-        if len(date_str) == 10 and date_str.count('-') == 2:
-            try:
-                # Validate it's a proper date
-                datetime.strptime(date_str, '%Y-%m-%d')
-                return date_str
-            except ValueError:
-                pass
+        if _is_iso_date(date_str):
+            return date_str
         
-        # Try various common formats
-        formats_to_try = [
-            '%m/%d/%y',      # 8/4/25
-            '%m/%d/%Y',      # 8/4/2025
-            '%m-%d-%y',      # 8-4-25
-            '%m-%d-%Y',      # 8-4-2025
-            '%Y-%m-%d',      # 2025-08-28
-            '%Y/%m/%d',      # 2025/08/28
-            '%d/%m/%y',      # 4/8/25 (day first)
-            '%d/%m/%Y',      # 4/8/2025 (day first)
-        ]
+        # Month-first slash dates, the most common shape on the errata pages
+        match = US_DATE_PATTERN.fullmatch(date_str)
+        if match:
+            month, day, year = (int(part) for part in match.groups())
+            if len(match.group(3)) == 2:
+                # Same two-digit year pivot as strptime's %y
+                year += 2000 if year < 69 else 1900
+            if year >= 100:
+                try:
+                    return datetime(year, month, day).strftime('%Y-%m-%d')
+                except ValueError:
+                    pass
         
-        for fmt in formats_to_try:
+        # Try various common formats
+        for fmt in DATE_FORMATS:
             try:
                 parsed_date = datetime.strptime(date_str, fmt)
                 # Convert 2-digit years to 4-digit (assume 2000s)
@@ -79,12 +120,14 @@ class CSVWriter:
         self.logger.warning(f"Could not parse date format: '{date_str}', keeping original")
         return date_str
     
-    def normalize_errata_dates(self, errata_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def normalize_errata_dates(self, errata_list: List[Dict[str, Any]],
+                               extracted_date: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Normalize date formats in errata records.
         
         Args:
             errata_list: List of errata records
+            extracted_date: If given, used as Date_Extracted for records without one
             
         Returns:
             List[Dict[str, Any]]: Errata records with normalized dates
@@ -98,8 +141,10 @@ class CSVWriter:
             if 'Date_Updated' in normalized_errata:
                 normalized_errata['Date_Updated'] = self.normalize_date(normalized_errata['Date_Updated'])
             
-            # Normalize Date_Extracted field if it exists
-            if 'Date_Extracted' in normalized_errata:
+            # Stamp records missing Date_Extracted, otherwise normalize it
+            if extracted_date and not normalized_errata.get('Date_Extracted'):
+                normalized_errata['Date_Extracted'] = extracted_date
+            elif 'Date_Extracted' in normalized_errata:
                 normalized_errata['Date_Extracted'] = self.normalize_date(normalized_errata['Date_Extracted'])
             
             normalized_list.append(normalized_errata)
@@ -119,9 +164,8 @@ class CSVWriter:
                 backup_filename = f"errata_changes_backup_{timestamp}.csv"
                 backup_file_path = self.backup_path / backup_filename
                 
-                # Copy existing file to backup location
-                import shutil
-                shutil.copy2(self.csv_path, backup_file_path)
+                # Copy contents only; copyfile uses the kernel fast-copy path where available
+                shutil.copyfile(self.csv_path, backup_file_path)
                 
                 self.logger.info(f"Backup created: {backup_file_path}")
                 return True
@@ -145,30 +189,25 @@ class CSVWriter:
             bool: True if write successful
         """
         try:
-            # Normalize date formats first
-            normalized_errata = self.normalize_errata_dates(errata_list)
-            
-            # Add extraction timestamp to each record
+            # Normalize date formats and add the extraction date in one pass
             current_time = datetime.now().strftime("%Y-%m-%d")  # Use consistent YYYY-MM-DD format
+            normalized_errata = self.normalize_errata_dates(errata_list, extracted_date=current_time)
             
-            for errata in normalized_errata:
-                if 'Date_Extracted' not in errata or not errata['Date_Extracted']:
-                    errata['Date_Extracted'] = current_time
-            
-            # Convert to DataFrame for easier manipulation
-            df = pd.DataFrame(normalized_errata)
-            
-            # Ensure all required columns are present
-            for col in self.columns:
-                if col not in df.columns:
-                    df[col] = ""  # Add empty column if missing
-            
-            # Reorder columns to match configuration
-            df = df[self.columns]
-            
-            # Write to CSV
+            # Write to CSV in configured column order; missing columns are left empty
             write_header = mode == 'w' or not self.csv_path.exists()
-            df.to_csv(self.csv_path, mode=mode, index=False, header=write_header, encoding='utf-8')
+            index_was_fresh = self._key_index_is_fresh()
+            with open(self.csv_path, mode, newline='', encoding='utf-8') as f:
+                writer = self._create_dict_writer(f)
+                if write_header:
+                    writer.writeheader()
+                writer.writerows(normalized_errata)
+            
+            # Keep the key index in step with the file; a stale one is rebuilt on demand
+            key_hashes = (self._key_hash(errata) for errata in normalized_errata)
+            if write_header:
+                self._write_key_index(key_hashes)
+            elif index_was_fresh:
+                self._write_key_index(key_hashes, mode='a')
             
             self.logger.info(f"Successfully wrote {len(normalized_errata)} errata records to {self.csv_path}")
             return True
@@ -188,7 +227,90 @@ class CSVWriter:
             bool: True if append successful
         """
         return self.write_errata_data(errata_list, mode='a')
-    
+
+    def _create_dict_writer(self, f) -> csv.DictWriter:
+        """Create a CSV writer for the configured columns, matching the existing file format."""
+        return csv.DictWriter(
+            f,
+            fieldnames=self.columns,
+            restval='',
+            extrasaction='ignore',
+            lineterminator='\n'
+        )
+
+    def open_stream(self) -> None:
+        """
+        Open the CSV file for incremental writes.
+
+        Records are written to a partial file next to the CSV and only moved
+        into place by close_stream(), so an interrupted run never replaces the
+        existing data with an incomplete file.
+        """
+        self.close_stream(commit=False)
+
+        self._stream_path = self.csv_path.with_name(self.csv_path.name + '.partial')
+        self._stream_file = open(self._stream_path, 'w', newline='', encoding='utf-8')
+        self._stream_writer = self._create_dict_writer(self._stream_file)
+        self._stream_writer.writeheader()
+        self._stream_count = 0
+        self._stream_key_hashes = []
+
+    def write_stream_rows(self, errata_list: List[Dict[str, Any]]) -> int:
+        """
+        Write a batch of errata records to the open stream.
+
+        Args:
+            errata_list: List of dictionaries containing errata data
+
+        Returns:
+            int: Total number of records written to the stream so far
+        """
+        current_time = datetime.now().strftime("%Y-%m-%d")
+        normalized_errata = self.normalize_errata_dates(errata_list, extracted_date=current_time)
+
+        self._stream_writer.writerows(normalized_errata)
+        self._stream_key_hashes.extend(self._key_hash(errata) for errata in normalized_errata)
+        # Flush per batch so completed pages survive a crash
+        self._stream_file.flush()
+        self._stream_count += len(normalized_errata)
+
+        return self._stream_count
+
+    def close_stream(self, commit: bool = True) -> bool:
+        """
+        Close the stream opened by open_stream().
+
+        Args:
+            commit: Replace the CSV file with the streamed data. When False, a
+                partial file holding records is kept for inspection and an
+                empty one is removed.
+
+        Returns:
+            bool: True if the streamed data was committed to the CSV file
+        """
+        if self._stream_file is None:
+            return False
+
+        self._stream_file.close()
+        self._stream_file = None
+
+        try:
+            if commit:
+                os.replace(self._stream_path, self.csv_path)
+                self._write_key_index(self._stream_key_hashes)
+                self.logger.info(f"Successfully wrote {self._stream_count} errata records to {self.csv_path}")
+                return True
+
+            if self._stream_count:
+                self.logger.warning(f"Partial extraction with {self._stream_count} records kept at {self._stream_path}")
+            else:
+                self._stream_path.unlink()
+            return False
+
+        except Exception as e:
+            self.logger.error(f"Failed to close CSV stream: {e}")
+            return False
+
     def load_existing_data(self) -> pd.DataFrame:
         """
         Load existing CSV data for comparison and deduplication.
@@ -209,6 +331,65 @@ class CSVWriter:
             self.logger.error(f"Failed to load existing data: {e}")
             return pd.DataFrame(columns=self.columns)
     
+    @staticmethod
+    def _record_key(record: Dict[str, Any]) -> tuple:
+        """Build the duplicate-detection key of a record, comparing values as text."""
+        return tuple(str(record.get(column) or '') for column in DEDUP_KEY_COLUMNS)
+    
+    def _key_hash(self, record: Dict[str, Any]) -> str:
+        """Hash a record's duplicate-detection key for the sidecar index."""
+        key_text = '\x1f'.join(self._record_key(record))
+        return hashlib.blake2b(key_text.encode('utf-8'), digest_size=16).hexdigest()
+    
+    def _key_index_is_fresh(self) -> bool:
+        """Check whether the key index was written after the CSV file last changed."""
+        try:
+            return self.keys_path.stat().st_mtime_ns >= self.csv_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return False
+    
+    def _write_key_index(self, key_hashes, mode: str = 'w') -> None:
+        """
+        Write or append key hashes to the sidecar index.
+        
+        Args:
+            key_hashes: Iterable of record key hashes
+            mode: Write mode ('w' to replace the index, 'a' to append)
+        """
+        try:
+            with open(self.keys_path, mode, encoding='utf-8') as f:
+                f.writelines(f"{key_hash}\n" for key_hash in key_hashes)
+        except OSError as e:
+            # An incomplete index must not look fresh
+            self.logger.warning(f"Could not update key index {self.keys_path}: {e}")
+            self.keys_path.unlink(missing_ok=True)
+    
+    def _load_existing_keys(self) -> set:
+        """
+        Load the key hashes of the records already in the CSV file.
+        
+        The sidecar index is used when it is up to date; otherwise it is rebuilt
+        from the CSV file.
+        
+        Returns:
+            set: Key hashes of existing records (empty if there is no file)
+        """
+        if not self.csv_path.exists():
+            self.logger.info("No existing CSV file found")
+            return set()
+        
+        if self._key_index_is_fresh():
+            existing_keys = set(self.keys_path.read_text(encoding='utf-8').splitlines())
+            self.logger.info(f"Loaded {len(existing_keys)} existing record keys from {self.keys_path}")
+            return existing_keys
+        
+        with open(self.csv_path, newline='', encoding='utf-8') as f:
+            existing_keys = {self._key_hash(row) for row in csv.DictReader(f)}
+        self._write_key_index(existing_keys)
+        
+        self.logger.info(f"Rebuilt key index with {len(existing_keys)} existing record keys from {self.csv_path}")
+        return existing_keys
+    
     def deduplicate_errata(self, new_errata: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Remove duplicates from new errata data based on existing records.
@@ -220,28 +401,16 @@ class CSVWriter:
             List[Dict[str, Any]]: Deduplicated errata records
         """
         try:
-            existing_df = self.load_existing_data()
+            existing_keys = self._load_existing_keys()
             
-            if existing_df.empty:
+            if not existing_keys:
                 return new_errata
             
-            new_df = pd.DataFrame(new_errata)
-            
-            # Define key columns for duplicate detection
-            key_columns = ['Unit', 'Resource', 'Location', 'Instructional_Moment', 'Page_Numbers']
-            
-            # Find duplicates by comparing key columns
-            merged = new_df.merge(
-                existing_df[key_columns], 
-                on=key_columns, 
-                how='left', 
-                indicator=True
-            )
-            
-            # Keep only records that don't exist in the existing data
-            unique_records = merged[merged['_merge'] == 'left_only'].drop('_merge', axis=1)
-            
-            deduplicated_list = unique_records.to_dict('records')
+            # Keep only records whose key columns don't exist in the existing data
+            deduplicated_list = [
+                errata for errata in new_errata
+                if self._key_hash(errata) not in existing_keys
+            ]
             
             duplicates_found = len(new_errata) - len(deduplicated_list)
             if duplicates_found > 0:
@@ -264,37 +433,43 @@ class CSVWriter:
             str: Summary report text
         """
         try:
-            df = pd.DataFrame(errata_list)
-            
-            if df.empty:
+            if not errata_list:
                 return "No errata data found."
             
+            # Count all three fields in a single pass; missing values are not counted
+            counts = {column: Counter() for column in ('Unit', 'Resource', 'Improvement_Type')}
+            for errata in errata_list:
+                for column, column_counts in counts.items():
+                    value = errata.get(column)
+                    if value is not None:
+                        column_counts[value] += 1
+            
+            # Only report fields that appear in the records
+            present = {column for errata in errata_list for column in counts if column in errata}
+            
             summary = []
-            summary.append(f"Total Errata Records: {len(df)}")
+            summary.append(f"Total Errata Records: {len(errata_list)}")
             summary.append(f"Extraction Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
             summary.append("")
             
             # Summary by Unit
-            if 'Unit' in df.columns:
-                unit_counts = df['Unit'].value_counts()
+            if 'Unit' in present:
                 summary.append("Records by Unit:")
-                for unit, count in unit_counts.items():
+                for unit, count in counts['Unit'].most_common():
                     summary.append(f"  {unit}: {count}")
                 summary.append("")
             
             # Summary by Resource
-            if 'Resource' in df.columns:
-                resource_counts = df['Resource'].value_counts()
+            if 'Resource' in present:
                 summary.append("Records by Resource:")
-                for resource, count in resource_counts.items():
+                for resource, count in counts['Resource'].most_common():
                     summary.append(f"  {resource}: {count}")
                 summary.append("")
             
             # Summary by Improvement Type
-            if 'Improvement_Type' in df.columns:
-                type_counts = df['Improvement_Type'].value_counts()
+            if 'Improvement_Type' in present:
                 summary.append("Records by Improvement Type:")
-                for imp_type, count in type_counts.items():
+                for imp_type, count in counts['Improvement_Type'].most_common():
                     summary.append(f"  {imp_type}: {count}")
             
             return "\n".join(summary)
@@ -326,11 +501,8 @@ class CSVWriter:
                 warnings.append(f"Record {record_num}: Missing Resource")
             
             # Check date format for Date_Updated if present
-            if errata.get('Date_Updated'):
-                try:
-                    datetime.strptime(errata['Date_Updated'], '%Y-%m-%d')
-                except ValueError:
-                    warnings.append(f"Record {record_num}: Invalid Date_Updated format (should be YYYY-MM-DD)")
+            if errata.get('Date_Updated') and not _is_iso_date(errata['Date_Updated']):
+                warnings.append(f"Record {record_num}: Invalid Date_Updated format (should be YYYY-MM-DD)")
             
             # Check for unusually long descriptions
             if errata.get('Improvement_Description') and len(errata['Improvement_Description']) > 500:
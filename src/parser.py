@@ -8,7 +8,114 @@ from typing import List, Dict, Any, Optional
 from datetime import datetime
 from bs4 import BeautifulSoup
 from selenium.webdriver.common.by import By
-from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+
+# Grade level patterns, tried in order; '{}' takes the first captured group
+TITLE_GRADE_PATTERNS = tuple((re.compile(pattern, re.IGNORECASE), grade_format) for pattern, grade_format in [
+    (r'kindergarten', 'Kindergarten'),
+    (r'accelerated[- ](\d+)', 'Grade {} Accelerated'),  # For "accelerated-6" and "accelerated-7"
+    (r'algebra[- ](\d+)[- ]extra[- ]support', 'Algebra {} Supports'),  # For "algebra-1-extra-support"
+    (r'grade\s*(\d+)', 'Grade {}'),
+    (r'algebra\s*(\d+)', 'Algebra {}'),
+    (r'geometry', 'Geometry'),
+    (r'pre-algebra', 'Pre-Algebra'),
+    (r'calculus', 'Calculus'),
+])
+
+URL_GRADE_PATTERNS = tuple((re.compile(pattern, re.IGNORECASE), grade_format) for pattern, grade_format in [
+    (r'kindergarten', 'Kindergarten'),
+    (r'grade-(\d+)', 'Grade {}'),
+    (r'accelerated-(\d+)', 'Grade {} Accelerated'),  # For accelerated courses
+    (r'algebra-(\d+)-extra-support', 'Algebra {} Supports'),  # For support courses
+    (r'algebra-(\d+)', 'Algebra {}'),
+    (r'geometry', 'Geometry'),
+    (r'pre-algebra', 'Pre-Algebra'),
+    (r'calculus', 'Calculus'),
+])
+
+# Per-record text patterns, compiled once instead of looked up on every row
+PAGE_NUMBERS_PATTERN = re.compile(r'(?:pgs?\.?\s*|pages?\s*)(\d+(?:-\d+)?(?:,\s*\d+(?:-\d+)?)*)', re.IGNORECASE)
+PAGE_REFERENCE_PATTERN = re.compile(r',?\s*(?:pgs?\.?\s*|pages?\s*)\d+(?:-\d+)?(?:,\s*\d+(?:-\d+)?)*', re.IGNORECASE)
+RESOURCE_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in [
+    r'(Teacher Edition.*?)(?:,|$)',
+    r'(Student Edition.*?)(?:,|$)',
+    r'(Teacher Guide.*?)(?:,|$)',
+    r'(Student Guide.*?)(?:,|$)',
+    r'(Glossary.*?)(?:,|$)',
+    r'(Answer Key.*?)(?:,|$)',
+])
+WHITESPACE_PATTERN = re.compile(r'\s+')
+PAGE_PREFIX_PATTERN = re.compile(r'\b(pages?|pp?\.?)\s*', re.IGNORECASE)
+PAGE_RANGE_PATTERN = re.compile(r'\d+(?:-\d+)?')
+
+# Date patterns as (pattern, year_first)
+DATE_PATTERNS = (
+    (re.compile(r'(\d{4})-(\d{1,2})-(\d{1,2})'), True),   # YYYY-MM-DD
+    (re.compile(r'(\d{1,2})/(\d{1,2})/(\d{4})'), False),  # MM/DD/YYYY
+    (re.compile(r'(\d{1,2})-(\d{1,2})-(\d{4})'), False),  # MM-DD-YYYY
+    (re.compile(r'(\d{4})/(\d{1,2})/(\d{1,2})'), True),   # YYYY/MM/DD
+)
+
+# Common abbreviations in categorical fields, applied in order
+ABBREVIATION_PATTERNS = tuple((re.compile(rf'\b{abbrev}\b', re.IGNORECASE), full_form) for abbrev, full_form in [
+    ('Te', 'Teacher Edition'),
+    ('Tg', 'Teacher Guide'),
+    ('Tcg', 'Teacher Course Guide'),
+    ('Se', 'Student Edition'),
+])
+
+# Cell texts of spacer rows that carry no errata data
+EMPTY_CELL_TEXTS = frozenset(('', '\xa0'))
+
+# Element locators used by the per-element fallback paths
+BUTTON_LOCATOR = (By.CSS_SELECTOR, "button")
+CELL_LOCATOR = (By.TAG_NAME, "td")
+
+# Clicks every collapsed accordion button and returns how many were clicked
+EXPAND_SECTIONS_SCRIPT = """
+var clicked = 0;
+arguments[0].forEach(function (section) {
+    var button = section.querySelector('button');
+    if (button && button.getAttribute('aria-expanded') === 'false') {
+        button.click();
+        clicked++;
+    }
+});
+return clicked;
+"""
+
+# Counts accordion buttons that have not reported themselves expanded yet
+COLLAPSED_SECTIONS_SCRIPT = """
+return arguments[0].filter(function (section) {
+    var button = section.querySelector('button');
+    return button && button.getAttribute('aria-expanded') === 'false';
+}).length;
+"""
+
+# Reads every accordion's unit name and table cell text in one browser round trip
+# (innerText matches what WebElement.text returns for visible elements)
+SECTION_DATA_SCRIPT = """
+var rowsSelector = arguments[1];
+return arguments[0].map(function (section) {
+    var button = section.querySelector('button');
+    var rows = Array.prototype.map.call(section.querySelectorAll(rowsSelector), function (row) {
+        return Array.prototype.map.call(row.querySelectorAll('td'), function (cell) {
+            return cell.innerText.trim();
+        });
+    });
+    return [button ? button.innerText.trim() : '', rows];
+});
+"""
+
+
+def _match_grade_level(text: str, patterns) -> Optional[str]:
+    """Return the grade level for the first pattern that matches text, if any."""
+    for pattern, grade_format in patterns:
+        match = pattern.search(text)
+        if match:
+            return grade_format.format(*match.groups())
+    return None
 
 
 class ErrataParser:
@@ -18,6 +125,10 @@ class ErrataParser:
         self.config = config
         self.logger = logging.getLogger(__name__)
         self.selectors = config['selectors']
+        
+        # Locators are built once and reused for every page this parser handles
+        self.container_locator = (By.CSS_SELECTOR, self.selectors['errata_container'])
+        self.rows_locator = (By.CSS_SELECTOR, self.selectors['table_rows'])
     
     def parse_page_with_selenium(self, driver) -> List[Dict[str, Any]]:
         """
@@ -37,19 +148,19 @@ class ErrataParser:
             grade_level = self._extract_grade_level(driver)
             
             # Find all accordion sections
-            accordion_sections = driver.find_elements(By.CSS_SELECTOR, self.selectors['errata_container'])
+            accordion_sections = driver.find_elements(*self.container_locator)
             
             self.logger.info(f"Found {len(accordion_sections)} accordion sections")
             
-            for section in accordion_sections:
-                # Extract unit name from the button
-                unit_name = self._extract_unit_name(section)
-                
-                # Expand the accordion if it's collapsed
-                self._expand_accordion_section(section, driver)
-                
-                # Extract data from the table in this section
-                table_data = self._extract_table_data(section, unit_name, grade_level)
+            # Expand the accordions if they're collapsed
+            self._expand_accordion_sections(accordion_sections, driver)
+            
+            # Read every unit name and table cell at once
+            section_data = self._extract_section_data(accordion_sections, driver)
+            
+            for unit_name, rows in section_data:
+                # Build records from the table in this section
+                table_data = self._extract_table_data(rows, unit_name, grade_level)
                 
                 if table_data:
                     errata_list.extend(table_data)
@@ -77,7 +188,7 @@ class ErrataParser:
         errata_list = []
         
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = BeautifulSoup(html_content, 'lxml')
             
             # Extract grade level from title or URL
             grade_level = self._extract_grade_level_from_strings(page_title, page_url)
@@ -118,60 +229,14 @@ class ErrataParser:
             # First try to extract from page title
             page_title = driver.title
             
-            # Common grade level patterns
-            grade_patterns = [
-                r'kindergarten',
-                r'accelerated[- ](\d+)',  # For "accelerated-6" and "accelerated-7"
-                r'algebra[- ](\d+)[- ]extra[- ]support',  # For "algebra-1-extra-support"
-                r'grade\s*(\d+)',
-                r'algebra\s*(\d+)',
-                r'geometry',
-                r'pre-algebra',
-                r'calculus'
-            ]
-            
-            import re
-            for pattern in grade_patterns:
-                match = re.search(pattern, page_title, re.IGNORECASE)
-                if match:
-                    if 'kindergarten' in pattern:
-                        return 'Kindergarten'
-                    elif 'accelerated' in pattern:
-                        return f'Grade {match.group(1)} Accelerated'
-                    elif 'extra[- ]support' in pattern:
-                        return f'Algebra {match.group(1)} Supports'
-                    elif 'grade' in pattern:
-                        return f'Grade {match.group(1)}'
-                    elif 'algebra' in pattern and 'extra' not in pattern:
-                        return f'Algebra {match.group(1)}'
-                    elif 'geometry' in pattern:
-                        return 'Geometry'
-                    elif 'pre-algebra' in pattern:
-                        return 'Pre-Algebra'
-                    elif 'calculus' in pattern:
-                        return 'Calculus'
+            grade_level = _match_grade_level(page_title, TITLE_GRADE_PATTERNS)
+            if grade_level:
+                return grade_level
             
             # Fallback: try to extract from URL
-            current_url = driver.current_url
-            
-            url_patterns = [
-                (r'kindergarten', 'Kindergarten'),
-                (r'grade-(\d+)', 'Grade {}'),
-                (r'accelerated-(\d+)', 'Grade {} Accelerated'),  # For accelerated courses
-                (r'algebra-(\d+)-extra-support', 'Algebra {} Supports'),  # For support courses
-                (r'algebra-(\d+)', 'Algebra {}'),
-                (r'geometry', 'Geometry'),
-                (r'pre-algebra', 'Pre-Algebra'),
-                (r'calculus', 'Calculus')
-            ]
-            
-            for pattern, format_str in url_patterns:
-                match = re.search(pattern, current_url, re.IGNORECASE)
-                if match:
-                    if '{}' in format_str:
-                        return format_str.format(match.group(1))
-                    else:
-                        return format_str
+            grade_level = _match_grade_level(driver.current_url, URL_GRADE_PATTERNS)
+            if grade_level:
+                return grade_level
             
             # If no pattern matches, try to extract any grade-related text from title
             title_words = page_title.lower().split()
@@ -185,6 +250,33 @@ class ErrataParser:
             self.logger.warning(f"Could not extract grade level: {e}")
             return "Unknown Grade"
 
+    def _extract_section_data(self, sections, driver) -> List[tuple]:
+        """
+        Extract unit names and table cell text for all accordion sections in a single browser call.
+        
+        Args:
+            sections: Selenium elements for the accordion sections
+            driver: Selenium WebDriver instance
+            
+        Returns:
+            List[tuple]: (unit_name, rows) for each section, where rows is a list of cell texts per row
+        """
+        try:
+            section_data = [
+                (unit_name or "", rows or [])
+                for unit_name, rows in driver.execute_script(
+                    SECTION_DATA_SCRIPT, sections, self.selectors['table_rows']
+                )
+            ]
+            self.logger.debug("Extracted unit names: %s", [unit_name for unit_name, _ in section_data])
+            return section_data
+        except Exception as e:
+            self.logger.warning(f"Could not batch extract section data, falling back to per-section lookup: {e}")
+            return [
+                (self._extract_unit_name(section), self._extract_row_texts(section))
+                for section in sections
+            ]
+    
     def _extract_unit_name(self, section) -> str:
         """
         Extract unit name from accordion section button.
@@ -196,41 +288,63 @@ class ErrataParser:
             str: Unit name or empty string if not found
         """
         try:
-            button = section.find_element(By.CSS_SELECTOR, "button")
+            button = section.find_element(*BUTTON_LOCATOR)
             unit_name = button.text.strip()
-            self.logger.debug(f"Extracted unit name: {unit_name}")
+            self.logger.debug("Extracted unit name: %s", unit_name)
             return unit_name
         except Exception as e:
             self.logger.warning(f"Could not extract unit name: {e}")
             return ""
     
-    def _expand_accordion_section(self, section, driver):
+    def _expand_accordion_sections(self, sections, driver):
         """
-        Expand accordion section if it's collapsed.
+        Expand all collapsed accordion sections with a single click script and one wait.
         
         Args:
-            section: Selenium element for accordion section
+            sections: Selenium elements for the accordion sections
             driver: Selenium WebDriver instance
         """
         try:
-            button = section.find_element(By.CSS_SELECTOR, "button")
-            aria_expanded = button.get_attribute("aria-expanded")
-            
-            if aria_expanded == "false":
-                self.logger.debug("Expanding collapsed accordion section")
-                driver.execute_script("arguments[0].click();", button)
-                # Small delay to let the accordion expand
-                import time
-                time.sleep(0.5)
+            clicked = driver.execute_script(EXPAND_SECTIONS_SCRIPT, sections)
+            if not clicked:
+                return
+            
+            self.logger.debug("Expanding %d collapsed accordion sections", clicked)
+            # Wait for every accordion to report itself expanded
+            try:
+                WebDriverWait(driver, 10).until(
+                    lambda d: d.execute_script(COLLAPSED_SECTIONS_SCRIPT, sections) == 0
+                )
+            except TimeoutException:
+                self.logger.debug("Some accordion sections did not report expanded state")
         except Exception as e:
-            self.logger.warning(f"Could not expand accordion section: {e}")
+            self.logger.warning(f"Could not expand accordion sections: {e}")
     
-    def _extract_table_data(self, section, unit_name: str, grade_level: str) -> List[Dict[str, Any]]:
+    def _extract_row_texts(self, section) -> List[List[str]]:
         """
-        Extract data from table within an accordion section.
+        Read the cell text of every table row in an accordion section, one element at a time.
         
         Args:
             section: Selenium element for accordion section
+            
+        Returns:
+            List[List[str]]: Stripped cell texts for each row
+        """
+        try:
+            return [
+                [cell.text.strip() for cell in row.find_elements(*CELL_LOCATOR)]
+                for row in section.find_elements(*self.rows_locator)
+            ]
+        except Exception as e:
+            self.logger.warning(f"Could not read table rows: {e}")
+            return []
+    
+    def _extract_table_data(self, rows: List[List[str]], unit_name: str, grade_level: str) -> List[Dict[str, Any]]:
+        """
+        Build errata records from the table rows of an accordion section.
+        
+        Args:
+            rows: Stripped cell texts for each table row in the section
             unit_name: Name of the unit/section
             grade_level: Grade level for this page
             
@@ -240,14 +354,16 @@ class ErrataParser:
         records = []
         
         try:
-            # Find table rows in this section
-            rows = section.find_elements(By.CSS_SELECTOR, self.selectors['table_rows'])
+            self.logger.debug("Found %d table rows in section '%s'", len(rows), unit_name)
             
-            self.logger.debug(f"Found {len(rows)} table rows in section '{unit_name}'")
+            # Same extraction date for every row in the section
+            date_extracted = datetime.now().strftime('%Y-%m-%d')
             
-            for row in rows:
+            for cells in rows:
                 try:
-                    cells = row.find_elements(By.TAG_NAME, "td")
+                    # Skip spacer rows before doing any parsing work
+                    if all(cell in EMPTY_CELL_TEXTS for cell in cells):
+                        continue
                     
                     if len(cells) >= 3:
                         # Extract data based on discovered structure:
@@ -255,15 +371,13 @@ class ErrataParser:
                         # Column 2: Improvement Description  
                         # Column 3: Date Updated
                         
-                        component_text = cells[0].text.strip()
-                        improvement_text = cells[1].text.strip()
-                        date_text = cells[2].text.strip()
+                        component_text, improvement_text, date_text = cells[:3]
                         
                         # Parse component text to extract Resource and Location
                         resource, location, page_numbers = self._parse_component_text(component_text)
                         
                         errata_record = {
-                            'Date_Extracted': datetime.now().strftime('%Y-%m-%d'),
+                            'Date_Extracted': date_extracted,
                             'Grade_Level': grade_level,
                             'Unit': unit_name,
                             'Resource': resource,
@@ -309,27 +423,18 @@ class ErrataParser:
         
         # Extract page numbers first
         page_numbers = ""
-        page_match = re.search(r'(?:pgs?\.?\s*|pages?\s*)(\d+(?:-\d+)?(?:,\s*\d+(?:-\d+)?)*)', component_text, re.IGNORECASE)
+        page_match = PAGE_NUMBERS_PATTERN.search(component_text)
         if page_match:
             page_numbers = page_match.group(1)
             # Remove page info from component text
-            component_text = re.sub(r',?\s*(?:pgs?\.?\s*|pages?\s*)\d+(?:-\d+)?(?:,\s*\d+(?:-\d+)?)*', '', component_text, flags=re.IGNORECASE).strip()
-        
-        # Try to identify common resource types
-        resource_patterns = [
-            r'(Teacher Edition.*?)(?:,|$)',
-            r'(Student Edition.*?)(?:,|$)',
-            r'(Teacher Guide.*?)(?:,|$)',
-            r'(Student Guide.*?)(?:,|$)',
-            r'(Glossary.*?)(?:,|$)',
-            r'(Answer Key.*?)(?:,|$)',
-        ]
+            component_text = PAGE_REFERENCE_PATTERN.sub('', component_text).strip()
         
         resource = ""
         location = ""
         
-        for pattern in resource_patterns:
-            match = re.search(pattern, component_text, re.IGNORECASE)
+        # Try to identify common resource types
+        for pattern in RESOURCE_PATTERNS:
+            match = pattern.search(component_text)
             if match:
                 resource = match.group(1).strip()
                 # Remove the resource part to get location
@@ -355,63 +460,13 @@ class ErrataParser:
         Returns:
             str: Grade level
         """
-        import re
-        
-        # Try title first
-        if page_title:
-            grade_patterns = [
-                r'kindergarten',
-                r'accelerated[- ](\d+)',  # For "accelerated-6" and "accelerated-7"
-                r'algebra[- ](\d+)[- ]extra[- ]support',  # For "algebra-1-extra-support"
-                r'grade\s*(\d+)',
-                r'algebra\s*(\d+)',
-                r'geometry',
-                r'pre-algebra',
-                r'calculus'
-            ]
-            
-            for pattern in grade_patterns:
-                match = re.search(pattern, page_title, re.IGNORECASE)
-                if match:
-                    if 'kindergarten' in pattern:
-                        return 'Kindergarten'
-                    elif 'accelerated' in pattern:
-                        return f'Grade {match.group(1)} Accelerated'
-                    elif 'extra[- ]support' in pattern:
-                        return f'Algebra {match.group(1)} Supports'
-                    elif 'grade' in pattern:
-                        return f'Grade {match.group(1)}'
-                    elif 'algebra' in pattern and 'extra' not in pattern:
-                        return f'Algebra {match.group(1)}'
-                    elif 'geometry' in pattern:
-                        return 'Geometry'
-                    elif 'pre-algebra' in pattern:
-                        return 'Pre-Algebra'
-                    elif 'calculus' in pattern:
-                        return 'Calculus'
-        
-        # Try URL if title didn't work
-        if page_url:
-            url_patterns = [
-                (r'kindergarten', 'Kindergarten'),
-                (r'grade-(\d+)', 'Grade {}'),
-                (r'accelerated-(\d+)', 'Grade {} Accelerated'),  # For accelerated courses
-                (r'algebra-(\d+)-extra-support', 'Algebra {} Supports'),  # For support courses
-                (r'algebra-(\d+)', 'Algebra {}'),
-                (r'geometry', 'Geometry'),
-                (r'pre-algebra', 'Pre-Algebra'),
-                (r'calculus', 'Calculus')
-            ]
-            
-            for pattern, format_str in url_patterns:
-                match = re.search(pattern, page_url, re.IGNORECASE)
-                if match:
-                    if '{}' in format_str:
-                        return format_str.format(match.group(1))
-                    else:
-                        return format_str
+        # Try title first, then the URL
+        grade_level = (
+            (page_title and _match_grade_level(page_title, TITLE_GRADE_PATTERNS))
+            or (page_url and _match_grade_level(page_url, URL_GRADE_PATTERNS))
+        )
         
-        return "Unknown Grade"
+        return grade_level or "Unknown Grade"
     
     def _extract_unit_name_soup(self, section) -> str:
         """
@@ -427,7 +482,7 @@ class ErrataParser:
             button = section.select_one("button")
             if button:
                 unit_name = button.get_text(strip=True)
-                self.logger.debug(f"Extracted unit name: {unit_name}")
+                self.logger.debug("Extracted unit name: %s", unit_name)
                 return unit_name
             return ""
         except Exception as e:
@@ -452,7 +507,10 @@ class ErrataParser:
             # Find table rows in this section
             rows = section.select(self.selectors['table_rows'])
             
-            self.logger.debug(f"Found {len(rows)} table rows in section '{unit_name}'")
+            self.logger.debug("Found %d table rows in section '%s'", len(rows), unit_name)
+            
+            # Same extraction date for every row in the section
+            date_extracted = datetime.now().strftime('%Y-%m-%d')
             
             for row in rows:
                 try:
@@ -468,11 +526,15 @@ class ErrataParser:
                         improvement_text = cells[1].get_text(strip=True)
                         date_text = cells[2].get_text(strip=True)
                         
+                        # Skip spacer rows before doing any parsing work
+                        if {component_text, improvement_text, date_text} <= EMPTY_CELL_TEXTS:
+                            continue
+                        
                         # Parse component text to extract Resource and Location
                         resource, location, page_numbers = self._parse_component_text(component_text)
                         
                         errata_record = {
-                            'Date_Extracted': datetime.now().strftime('%Y-%m-%d'),
+                            'Date_Extracted': date_extracted,
                             'Grade_Level': grade_level,
                             'Unit': unit_name,
                             'Resource': resource,
@@ -589,7 +651,7 @@ class ErrataParser:
         except NoSuchElementException:
             return ""
         except Exception as e:
-            self.logger.debug(f"Failed to extract text with selector '{selector}': {e}")
+            self.logger.debug("Failed to extract text with selector '%s': %s", selector, e)
             return ""
     
     def _safe_extract_soup_text(self, container, selector: str) -> str:
@@ -609,7 +671,7 @@ class ErrataParser:
                 return element.get_text(strip=True)
             return ""
         except Exception as e:
-            self.logger.debug(f"Failed to extract text with selector '{selector}': {e}")
+            self.logger.debug("Failed to extract text with selector '%s': %s", selector, e)
             return ""
     
     def _clean_errata_data(self, errata_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -627,7 +689,7 @@ class ErrataParser:
         for key, value in errata_data.items():
             if isinstance(value, str):
                 # Remove extra whitespace and normalize
-                cleaned_value = re.sub(r'\s+', ' ', value.strip())
+                cleaned_value = WHITESPACE_PATTERN.sub(' ', value.strip())
                 
                 # Specific cleaning for different fields
                 if key == 'Page_Numbers':
@@ -660,10 +722,10 @@ class ErrataParser:
         # Examples: "pages 12-15" -> "12-15", "page 7" -> "7", "pp. 20, 25" -> "20, 25"
         
         # Remove common prefixes/suffixes
-        page_text = re.sub(r'\b(pages?|pp?\.?)\s*', '', page_text, flags=re.IGNORECASE)
+        page_text = PAGE_PREFIX_PATTERN.sub('', page_text)
         
         # Extract number ranges and individual numbers
-        numbers = re.findall(r'\d+(?:-\d+)?', page_text)
+        numbers = PAGE_RANGE_PATTERN.findall(page_text)
         
         if numbers:
             return ', '.join(numbers)
@@ -684,18 +746,11 @@ class ErrataParser:
             return ""
         
         # Common date patterns to try
-        date_patterns = [
-            r'(\d{4})-(\d{1,2})-(\d{1,2})',  # YYYY-MM-DD
-            r'(\d{1,2})/(\d{1,2})/(\d{4})',   # MM/DD/YYYY
-            r'(\d{1,2})-(\d{1,2})-(\d{4})',   # MM-DD-YYYY
-            r'(\d{4})/(\d{1,2})/(\d{1,2})',   # YYYY/MM/DD
-        ]
-        
-        for pattern in date_patterns:
-            match = re.search(pattern, date_text)
+        for pattern, year_first in DATE_PATTERNS:
+            match = pattern.search(date_text)
             if match:
                 try:
-                    if pattern.startswith(r'(\d{4})'):  # Year first
+                    if year_first:
                         year, month, day = match.groups()
                     else:  # Month/day first
                         month, day, year = match.groups()
@@ -725,15 +780,8 @@ class ErrataParser:
         normalized = ' '.join(word.capitalize() for word in text.split())
         
         # Handle common abbreviations and formats
-        abbreviations = {
-            'Te': 'Teacher Edition',
-            'Tg': 'Teacher Guide',
-            'Tcg': 'Teacher Course Guide',
-            'Se': 'Student Edition',
-        }
-        
-        for abbrev, full_form in abbreviations.items():
-            normalized = re.sub(rf'\b{abbrev}\b', full_form, normalized, flags=re.IGNORECASE)
+        for pattern, full_form in ABBREVIATION_PATTERNS:
+            normalized = pattern.sub(full_form, normalized)
         
         return normalized
     
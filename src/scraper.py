@@ -7,6 +7,11 @@ import logging
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 
+from bs4 import BeautifulSoup
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+
 from auth import WebAuthenticator, load_credentials, AuthenticationError
 from parser import ErrataParser
 from csv_writer import CSVWriter
@@ -32,7 +37,7 @@ class ErrataScraper:
         Run the complete errata extraction process.
         
         Args:
-            use_selenium: Whether to use Selenium (True) or requests-html (False)
+            use_selenium: Whether to use Selenium (True) or requests (False)
             
         Returns:
             bool: True if extraction completed successfully
@@ -162,8 +167,13 @@ class ErrataScraper:
                 
                 driver.get(url)
                 
-                # Wait for page to load
-                time.sleep(2)
+                # Wait for the errata container rather than a fixed sleep; with the
+                # eager load strategy, late analytics scripts are not waited on
+                try:
+                    wait = WebDriverWait(driver, 10)
+                    wait.until(EC.presence_of_element_located(self.parser.container_locator))
+                except TimeoutException:
+                    self.logger.warning(f"Timed out waiting for errata content on {url}")
                 
                 # Extract metadata
                 metadata = self.parser.extract_metadata(driver)
@@ -178,17 +188,15 @@ class ErrataScraper:
                     self.logger.error("No authenticated session available")
                     return []
                 
-                response = session.get(url)
-                response.html.render()  # Execute JavaScript if needed
+                response = session.get(url, timeout=self.config['scraping'].get('timeout', 30))
                 
                 # Extract metadata
-                from bs4 import BeautifulSoup
-                soup = BeautifulSoup(response.html.html, 'html.parser')
+                soup = BeautifulSoup(response.text, 'lxml')
                 metadata = self.parser.extract_metadata(soup)
                 self.extraction_metadata[url] = metadata
                 
                 # Parse errata data
-                return self.parser.parse_page_with_beautifulsoup(response.html.html)
+                return self.parser.parse_page_with_beautifulsoup(response.text)
                 
         except Exception as e:
             self.logger.error(f"Failed to extract from {url}: {e}")